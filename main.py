@@ -3,8 +3,18 @@ from __future__ import annotations
 import re
 import os
 import asyncio
+import functools
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
+# cachetools 为可选依赖：缺失时使用下方的简易 TTL 缓存
+try:
+    from cachetools import TTLCache
+except Exception:
+    TTLCache = None
+
 # jmcomic: use public API recommended usage
 try:
     from jmcomic import jm_option, jm_client_new, JmcomicUI
@@ -24,6 +34,30 @@ except Exception:
     SearchResult = None
     JmAlbumDetail = None
 
+# jmcomic 在 retry_times 次重试全部失败后抛出该异常
+try:
+    from jmcomic.jm_exception import RequestRetryAllFailException
+except Exception:
+    RequestRetryAllFailException = None
+
+# curl_cffi 为 jmcomic 默认 postman 的传输层，retry_times 为 0 时其异常会直接抛出
+try:
+    from curl_cffi.requests.exceptions import (
+        ConnectionError as CurlConnectionError,
+        Timeout as CurlTimeout
+    )
+except Exception:
+    CurlConnectionError = None
+    CurlTimeout = None
+
+# requests 为可选依赖：存在时为客户端会话配置连接池
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except Exception:
+    requests = None
+    HTTPAdapter = None
+
 # 导入 AstrBot 相关的库（仅使用公开 api）
 from astrbot.api.event import filter
 from astrbot.api.star import Context, register, Star
@@ -59,6 +93,104 @@ PLUGIN_VERSION = "1.2.0"
 PLUGIN_AUTHOR = "yuxin"
 PLUGIN_DESC = "JMComicDownloader 插件集,仅aiocqhttp支持。"
 
+# 回复文本
+_ERR_NO_LIB = "错误：jmcomic 库未正确安装，请联系管理员。"
+# /jm
+_ERR_INVALID_ID = "请提供有效的漫画 ID。"
+_MSG_RECEIVED = "收到！准备处理漫画 ID: {album_ids}..."
+_MSG_CACHE_HIT = "找到本地缓存，准备发送..."
+_MSG_DOWNLOAD_START = "开始下载漫画 {album_id}，这可能需要一些时间..."
+_MSG_DOWNLOAD_INFLIGHT = "漫画 {album_id} 正在下载中，完成后将一并发送..."
+_ERR_INFLIGHT_FAILED = "漫画 {album_id} 处理失败，请稍后重试。"
+_ERR_DOWNLOAD_FAILED = "下载 {album_id} 失败: {msg}"
+_ERR_PDF_PACK = "下载成功，但 PDF 打包失败。请检查后台日志。"
+_ERR_PROCESS = "处理时发生错误: {error}"
+_MSG_SEND_DONE = "漫画 {album_id} 已发送完成。"
+_ERR_SEND_FILE = "发送文件失败: {error}"
+# /jm_status
+_MSG_STATUS_CHECKING = "正在检查登录状态..."
+_MSG_LOGIN_OK = "登录成功！\n用户: {username}\nEmail: {email}\nVIP: {vip}"
+_MSG_LOGIN_NONE = "未登录。\n信息: {msg}\n请检查配置中的登录信息或 cookies 是否有效。"
+_ERR_STATUS = "检查登录状态时出错: {error}"
+# /jm_search
+_MSG_SEARCH_USAGE = "请输入搜索关键词。用法: /jm_search [关键词]"
+_MSG_SEARCHING = "正在搜索: '{keyword}'..."
+_ERR_SEARCH_FAILED = "搜索失败: {msg}"
+_MSG_SEARCH_EMPTY = "未找到与 '{keyword}' 相关的结果。"
+_MSG_SEARCH_HEADER = "搜索 '{keyword}' 的结果 (前 {count} 条):"
+_MSG_SEARCH_ITEM = "ID: {id}\n标题: {title}\n作者: {authors}"
+_MSG_SEARCH_FOOTER = "使用 /jm [ID] 来下载。"
+_ERR_SEARCH = "搜索时出错: {error}"
+
+# 漫画 ID: 3~8 位数字，不截取更长数字串的一部分
+_ID_RE = re.compile(r"(?<!\d)\d{3,8}(?!\d)")
+
+# 登录状态缓存时长（秒）
+_LOGIN_CACHE_TTL = 60
+
+# 视为临时错误、值得退避重试的异常类型（未安装的依赖对应为 None，予以跳过）
+_TRANSIENT_ERRORS = tuple(cls for cls in (
+    RequestRetryAllFailException,
+    ConnectionError,
+    TimeoutError,
+    CurlConnectionError,
+    CurlTimeout,
+    getattr(requests, "ConnectionError", None),
+    getattr(requests, "Timeout", None),
+) if cls is not None)
+
+
+class _SimpleTTLCache:
+    """cachetools 不可用时的简易替代：条目带过期时间，超出容量时淘汰最早写入的条目"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: dict = {}
+
+    def get(self, key, default=None):
+        item = self._data.get(key)
+        if item is None:
+            return default
+        expires_at, value = item
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return default
+        return value
+
+    def __setitem__(self, key, value):
+        self._data.pop(key, None)
+        if len(self._data) >= self.maxsize:
+            del self._data[next(iter(self._data))]
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+
+def _stat_or_none(path: str) -> os.stat_result | None:
+    """一次 stat 同时判断文件是否存在并获取大小"""
+    try:
+        return os.stat(path)
+    except OSError:
+        # 与 os.path.exists 一致：权限不足、路径非目录等均视为不存在
+        return None
+
+
+def _find_requests_session(client) -> "requests.Session | None":
+    """在 jmcomic 客户端上查找底层的 requests.Session"""
+    for owner in (client, getattr(client, "postman", None)):
+        if owner is None:
+            continue
+        for attr in ("session", "_session"):
+            session = getattr(owner, attr, None)
+            if isinstance(session, requests.Session):
+                return session
+    return None
+
+
+def _is_transient(exc: Exception) -> bool:
+    """判断异常是否为 jmcomic 重试耗尽 / 连接中断 / 超时等可重试的临时错误"""
+    return isinstance(exc, _TRANSIENT_ERRORS)
+
+
 @register(
     name=PLUGIN_NAME,
     author=PLUGIN_AUTHOR,
@@ -90,6 +222,9 @@ class JMComicDownloader(Star):
         # 3. 使用配置覆盖 JmOption
         self.download_dir = self.config.get("download_dir", "data/plugin_data/JMComicDownloader/pdf")
         os.makedirs(self.download_dir, exist_ok=True)
+        # 约定的 PDF 路径: [download_dir]/[ID].pdf（目录中的花括号需转义）
+        escaped_dir = self.download_dir.replace("{", "{{").replace("}", "}}")
+        self._pdf_path_template = os.path.join(escaped_dir, "{}.pdf")
         self.option.dir.download = self.download_dir
         self.log.info(f"漫画 PDF 将下载到: {os.path.abspath(self.download_dir)}")
 
@@ -114,169 +249,311 @@ class JMComicDownloader(Star):
         else:
             self.log.warning("未配置 jmcomic 用户名和密码，将以未登录状态运行。")
 
-        # 初始化客户端
+        # 限制同时进行的下载数量，其余请求在事件循环中排队
+        self.max_concurrent_downloads = max(1, int(self.config.get("max_concurrent_downloads", 3)))
+        self.download_sem = asyncio.Semaphore(self.max_concurrent_downloads)
+        # 单条消息最多处理的漫画 ID 数量
+        self.max_ids_per_message = max(1, int(self.config.get("max_ids_per_message", 20)))
+        # 每个 JM 主机保留复用的连接数（连接池大小，非并发上限），仅对 requests-session postman 生效
+        self.max_per_host = max(1, int(self.config.get("max_per_host", 8)))
+        # 独立线程池，避免占满 AstrBot 默认执行器影响其他插件；多留一个线程给搜索/状态查询
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_concurrent_downloads + 1,
+            thread_name_prefix="jm"
+        )
+
+        # 搜索结果缓存: 规范化关键词 -> SearchResult
+        cache_cls = TTLCache if TTLCache is not None else _SimpleTTLCache
+        self._search_cache = cache_cls(maxsize=256, ttl=300)
+        # 已解析的 PDF 路径: album_id -> pdf_path，避免重复扫描缓存目录
+        self._pdf_path_cache: dict[str, str] = {}
+        # 正在处理中的下载: album_id -> Future[pdf_path]，同一漫画的并发请求共享结果
+        self._inflight: dict[str, asyncio.Future] = {}
+        # 后台下载任务，保留引用防止被回收，卸载时统一取消
+        self._tasks: set[asyncio.Task] = set()
+        # 最近一次登录状态: (time.monotonic(), LoginResult)，短时间内重复查询直接复用
+        self._login_cache: tuple[float, LoginResult] | None = None
+
+        # 本地缓存查询只依赖 UI，直接创建；客户端在首次使用时再初始化，避免启动时的登录请求阻塞加载
         self.ui = JmcomicUI(self.option)
-        self.client = jm_client_new(self.option)
-        self.log.info("JMComicDownloader 插件已加载，客户端已初始化。")
+        self._client = None
+        self._client_lock = asyncio.Lock()
+        self.log.info("JMComicDownloader 插件已加载，客户端将在首次使用时初始化。")
+
+    async def _get_client(self):
+        """获取 jmcomic 客户端，首次调用时在线程池中创建"""
+        async with self._client_lock:
+            if self._client is None:
+                client = await self._run_blocking(jm_client_new, self.option)
+                self._tune_http_session(client)
+                self._client = client
+                self.log.info("jmcomic 客户端已初始化。")
+            return self._client
+
+    def _tune_http_session(self, client):
+        """为客户端会话挂载持久连接池，同一漫画的图片及不同漫画之间复用 TLS 连接"""
+        if requests is None:
+            self.log.warning("未安装 requests，跳过连接池配置，下载将不会复用 HTTP 连接。")
+            return
+        session = _find_requests_session(client)
+        if session is None:
+            # jmcomic 默认的 curl_cffi postman 每次请求都新建连接，不持有 requests.Session
+            self.log.warning(
+                "jmcomic 客户端未暴露 requests.Session（默认 curl_cffi postman 即如此），"
+                "连接池配置未生效；如需复用连接，请在 jmcomic.yml 中使用会话型 postman（如 requests-session）。"
+            )
+            return
+
+        # 不启用 pool_block：requests 无法为等待连接设置超时，连接未归还时线程会永久阻塞；
+        # 超出 pool_maxsize 的请求临时新建连接，用完即关闭，只有 max_per_host 个连接被保留复用
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=self.max_per_host
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+    async def _run_blocking(self, fn, *args, **kwargs):
+        """在插件线程池中执行阻塞调用"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, functools.partial(fn, *args, **kwargs))
+
+    async def _with_retry(self, fn, *args, tries: int = 2, base: float = 1.0, **kwargs):
+        """
+        在线程池中执行阻塞调用，遇到临时错误时按指数退避重试。
+        jmcomic 按 retry_times 逐个请求重试，全部失败后抛出 RequestRetryAllFailException，
+        这里在其之后退避再试一次；retry_times 为 0 时则直接处理 curl_cffi / requests 的连接与超时异常。
+        HTTP 层（连接池适配器）不再额外重试，避免重试次数层层相乘。
+        返回 ok == False 的结果不会重试：结果中没有状态码，无法区分限流与漫画不存在等永久错误。
+        """
+        for attempt in range(tries):
+            try:
+                return await self._run_blocking(fn, *args, **kwargs)
+            except Exception as e:
+                if attempt == tries - 1 or not _is_transient(e):
+                    raise
+                delay = base * 2 ** attempt + random.random() * 0.3
+                self.log.warning(f"调用 {getattr(fn, '__name__', fn)} 失败 ({e})，{delay:.1f} 秒后重试...")
+                await asyncio.sleep(delay)
 
     @filter("/jm {album_id}")
     async def handle_jm_command(self, ctx: "Context"):
         """处理 /jm 命令"""
         if jm_option is None:
-            await ctx.send("错误：jmcomic 库未正确安装，请联系管理员。")
+            await ctx.send(_ERR_NO_LIB)
             return
 
-        album_id = ctx.state.get("album_id", "").strip()
-        if not album_id.isdigit():
-            await ctx.send("请提供有效的漫画 ID。")
+        text_content = ctx.state.get("album_id", "")
+        # 去重并限制数量，防止超长输入产生大量任务
+        album_ids = list(dict.fromkeys(_ID_RE.findall(text_content)))[:self.max_ids_per_message]
+        if not album_ids:
+            await ctx.send(_ERR_INVALID_ID)
             return
 
-        await ctx.send(f"收到！准备处理漫画 ID: {album_id}...")
-        asyncio.create_task(self.process_download(ctx, album_id))
+        await ctx.send(_MSG_RECEIVED.format(album_ids=", ".join(album_ids)))
+        for album_id in album_ids:
+            task = asyncio.create_task(self.process_download(ctx, album_id))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
 
     @filter("/jm_status")
     async def handle_jm_status(self, ctx: "Context"):
         """处理 /jm_status 命令"""
         if jm_option is None:
-            await ctx.send("错误：jmcomic 库未正确安装。")
+            await ctx.send(_ERR_NO_LIB)
             return
 
-        await ctx.send("正在检查登录状态...")
+        await ctx.send(_MSG_STATUS_CHECKING)
 
         try:
-            loop = asyncio.get_event_loop()
-            login_result = await loop.run_in_executor(
-                None,
-                self.client.check_login
-            )
+            now = time.monotonic()
+            if self._login_cache and now - self._login_cache[0] < _LOGIN_CACHE_TTL:
+                login_result = self._login_cache[1]
+            else:
+                client = await self._get_client()
+                login_result = await self._run_blocking(client.check_login)
+                self._login_cache = (now, login_result)
             
             if login_result.is_login:
-                msg = (
-                    f"登录成功！\n"
-                    f"用户: {login_result.username}\n"
-                    f"Email: {login_result.email}\n"
-                    f"VIP: {login_result.vip}"
+                msg = _MSG_LOGIN_OK.format(
+                    username=login_result.username,
+                    email=login_result.email,
+                    vip=login_result.vip
                 )
             else:
-                msg = (
-                    f"未登录。\n"
-                    f"信息: {login_result.msg}\n"
-                    f"请检查配置中的登录信息或 cookies 是否有效。"
-                )
+                msg = _MSG_LOGIN_NONE.format(msg=login_result.msg)
             
             await ctx.send(msg)
 
         except Exception as e:
             self.log.exception(f"检查登录状态时出错: {e}")
-            await ctx.send(f"检查登录状态时出错: {e}")
+            await ctx.send(_ERR_STATUS.format(error=e))
 
     @filter("/jm_search {keyword}")
     async def handle_jm_search(self, ctx: "Context"):
         """处理 /jm_search 命令"""
         if jm_option is None:
-            await ctx.send("错误：jmcomic 库未正确安装，请联系管理员。")
+            await ctx.send(_ERR_NO_LIB)
             return
 
         keyword = ctx.state.get("keyword", "").strip()
         if not keyword:
-            await ctx.send("请输入搜索关键词。用法: /jm_search [关键词]")
+            await ctx.send(_MSG_SEARCH_USAGE)
             return
 
-        await ctx.send(f"正在搜索: '{keyword}'...")
+        await ctx.send(_MSG_SEARCHING.format(keyword=keyword))
 
         try:
-            loop = asyncio.get_event_loop()
-            search_result = await loop.run_in_executor(
-                None,
-                self.client.search_album,
-                keyword
-            )
+            cache_key = keyword.lower()
+            search_result = self._search_cache.get(cache_key)
+            if search_result is None:
+                client = await self._get_client()
+                search_result = await self._with_retry(client.search_album, keyword)
+                if search_result.ok:
+                    self._search_cache[cache_key] = search_result
 
             if not search_result.ok:
-                await ctx.send(f"搜索失败: {search_result.msg}")
+                await ctx.send(_ERR_SEARCH_FAILED.format(msg=search_result.msg))
                 return
 
             album_list = search_result.album_list
             if not album_list:
-                await ctx.send(f"未找到与 '{keyword}' 相关的结果。")
+                await ctx.send(_MSG_SEARCH_EMPTY.format(keyword=keyword))
                 return
 
             max_results = 5
-            reply_msg = f"搜索 '{keyword}' 的结果 (前 {len(album_list[:max_results])} 条):\n"
-            reply_msg += "--------------------------\n"
+            separator = "-" * 26
+            shown = album_list[:max_results]
+            lines = [_MSG_SEARCH_HEADER.format(keyword=keyword, count=len(shown)), separator]
 
-            for i, album in enumerate(album_list[:max_results]):
+            for album in shown:
                 authors = ", ".join(album.author_list) if album.author_list else "N/A"
-                reply_msg += f"ID: {album.id}\n"
-                reply_msg += f"标题: {album.title}\n"
-                reply_msg += f"作者: {authors}\n"
-                reply_msg += "--------------------------\n"
-            
-            reply_msg += "使用 /jm [ID] 来下载。"
-            await ctx.send(reply_msg)
+                lines.append(_MSG_SEARCH_ITEM.format(id=album.id, title=album.title, authors=authors))
+                lines.append(separator)
+
+            lines.append(_MSG_SEARCH_FOOTER)
+            await ctx.send("\n".join(lines))
 
         except Exception as e:
             self.log.exception(f"搜索 '{keyword}' 时发生错误: {e}")
-            await ctx.send(f"搜索时出错: {e}")
+            await ctx.send(_ERR_SEARCH.format(error=e))
 
     async def process_download(self, ctx: "Context", album_id: str):
-        """处理下载逻辑"""
+        """处理下载逻辑（同一漫画只下载一次）"""
+        inflight = self._inflight.get(album_id)
+        if inflight is not None:
+            self.log.info(f"{album_id} 正在处理中，等待已有任务完成...")
+            await ctx.send(_MSG_DOWNLOAD_INFLIGHT.format(album_id=album_id))
+            resolved = await asyncio.shield(inflight)
+            if resolved:
+                pdf_path, file_size = resolved
+                await self.send_file(ctx, pdf_path, album_id, file_size)
+            else:
+                await ctx.send(_ERR_INFLIGHT_FAILED.format(album_id=album_id))
+            return
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[album_id] = fut
+        resolved = None
+        try:
+            resolved = await self._resolve_pdf(ctx, album_id)
+        finally:
+            if not fut.done():
+                fut.set_result(resolved)
+            self._inflight.pop(album_id, None)
+
+        if resolved:
+            pdf_path, file_size = resolved
+            await self.send_file(ctx, pdf_path, album_id, file_size)
+
+    async def _resolve_pdf(self, ctx: "Context", album_id: str) -> tuple[str, int] | None:
+        """查找本地缓存，未命中时下载（受 max_concurrent_downloads 限制），成功时返回 (PDF 路径, 文件大小)"""
         try:
             self.log.info(f"正在为 {album_id} 搜索本地缓存...")
             
-            expected_pdf_name = f"{album_id}.pdf"
-            expected_pdf_path = os.path.join(self.download_dir, expected_pdf_name)
+            expected_pdf_path = self._pdf_path_template.format(album_id)
 
-            pdf_path = None
-            if os.path.exists(expected_pdf_path):
-                pdf_path = expected_pdf_path
-            else:
-                search_result = self.ui.search_cache(album_id)
-                if search_result.ok:
-                    pdf_path = next((fp for fp in search_result.file_list if fp.endswith(f"{album_id}.pdf")), None)
+            # 文件系统操作可能较慢，放入线程池避免阻塞事件循环
+            st = None
+            pdf_path = self._pdf_path_cache.get(album_id)
+            if pdf_path:
+                st = await self._run_blocking(_stat_or_none, pdf_path)
+                if st is None:
+                    # 文件已被删除，丢弃过期记录
+                    self._pdf_path_cache.pop(album_id, None)
+                    pdf_path = None
+
+            if not pdf_path:
+                st = await self._run_blocking(_stat_or_none, expected_pdf_path)
+                if st is not None:
+                    pdf_path = expected_pdf_path
+                else:
+                    search_result = await self._run_blocking(self.ui.search_cache, album_id)
+                    if search_result.ok:
+                        # 按完整文件名匹配，避免 350234 误命中 1350234.pdf
+                        target = os.path.basename(expected_pdf_path)
+                        pdf_path = next((fp for fp in search_result.file_list if os.path.basename(fp) == target), None)
+                        if pdf_path:
+                            st = await self._run_blocking(_stat_or_none, pdf_path)
+                            if st is None:
+                                pdf_path = None
 
             if pdf_path:
                 self.log.info(f"找到 {album_id} 的缓存: {pdf_path}")
-                await ctx.send("找到本地缓存，准备发送...")
-                await self.send_file(ctx, pdf_path, album_id)
-                return
+                self._pdf_path_cache[album_id] = pdf_path
+                await ctx.send(_MSG_CACHE_HIT)
+                return pdf_path, st.st_size
 
             self.log.info(f"未找到 {album_id} 的缓存，开始下载...")
-            await ctx.send(f"开始下载漫画 {album_id}，这可能需要一些时间...")
+            await ctx.send(_MSG_DOWNLOAD_START.format(album_id=album_id))
 
-            loop = asyncio.get_event_loop()
-            dl_result = await loop.run_in_executor(
-                None,
-                self.client.download_album,
-                album_id
-            )
+            client = await self._get_client()
+            # 只有实际下载占用并发名额，缓存命中与文件上传无需排队
+            async with self.download_sem:
+                dl_result = await self._with_retry(client.download_album, album_id)
 
             if not dl_result.ok:
-                await ctx.send(f"下载失败: {dl_result.msg}")
+                await ctx.send(_ERR_DOWNLOAD_FAILED.format(album_id=album_id, msg=dl_result.msg))
                 return
 
             final_pdf_path = dl_result.album.file_path
             if not final_pdf_path or not final_pdf_path.endswith(".pdf"):
                 self.log.warning(f"下载成功，但返回的路径 '{final_pdf_path}' 不符合预期。")
-                final_pdf_path = os.path.join(self.download_dir, f"{album_id}.pdf")
-                
-                if not os.path.exists(final_pdf_path):
-                    self.log.error(f"致命错误：PDF 文件 {final_pdf_path} 未生成。")
-                    await ctx.send(f"下载成功，但 PDF 打包失败。请检查后台日志。")
-                    return
+                final_pdf_path = expected_pdf_path
+
+            st = await self._run_blocking(_stat_or_none, final_pdf_path)
+            if st is None:
+                self.log.error(f"致命错误：PDF 文件 {final_pdf_path} 未生成。")
+                await ctx.send(_ERR_PDF_PACK)
+                return
 
             self.log.info(f"下载完成，文件位于: {final_pdf_path}")
-            await self.send_file(ctx, final_pdf_path, album_id)
+            self._pdf_path_cache[album_id] = final_pdf_path
+            return final_pdf_path, st.st_size
 
         except Exception as e:
             self.log.exception(f"处理 {album_id} 时发生错误: {e}")
-            await ctx.send(f"处理时发生错误: {e}")
+            await ctx.send(_ERR_PROCESS.format(error=e))
 
-    async def send_file(self, ctx: "Context", file_path: str, album_id: str):
+    async def send_file(self, ctx: "Context", file_path: str, album_id: str, file_size: int | None = None):
         """发送文件"""
         try:
+            if file_size is not None:
+                self.log.info(f"正在发送 {album_id} ({file_size / 1e6:.1f} MB)")
             await ctx.send(File(path=file_path))
-            await ctx.send(f"漫画 {album_id} 已发送完成。")
+            await ctx.send(_MSG_SEND_DONE.format(album_id=album_id))
         except Exception as e:
             self.log.error(f"发送文件失败: {e}")
-            await ctx.send(f"发送文件失败: {e}")
\ No newline at end of file
+            await ctx.send(_ERR_SEND_FILE.format(error=e))
+
+    async def terminate(self):
+        """插件卸载时取消未完成的下载任务并释放线程池"""
+        tasks = list(getattr(self, "_tasks", ()))
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        pool = getattr(self, "_pool", None)
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
\ No newline at end of file